@@ -5,11 +5,9 @@ general file-handling routines.
 
 __author__ = "dpark@broadinstitute.org"
 
-import codecs
 import contextlib
 import os
 import gzip
-import io
 import tempfile
 import subprocess
 import shutil
@@ -17,7 +15,6 @@ import errno
 import logging
 import json
 import sys
-import io
 import csv
 import inspect
 import tarfile
@@ -26,8 +23,6 @@ import util.cmd
 import util.misc
 
 from Bio import SeqIO
-from Bio.Seq import Seq
-from Bio.SeqRecord import SeqRecord
 from Bio.SeqIO import FastaIO
 
 # imports needed for download_file() and webfile_readlines()
@@ -45,16 +40,22 @@ class StringNotFoundException(Exception):
     pass
 
 
+_project_path = None
+
 def get_project_path():
     '''Return the absolute path of the top-level project, assumed to be the
-       parent of the directory containing this script.'''
-    # abspath converts relative to absolute path; expanduser interprets ~
-    path = __file__  # path to this script
-    path = os.path.expanduser(path)  # interpret ~
-    path = os.path.abspath(path)  # convert to absolute path
-    path = os.path.dirname(path)  # containing directory: util
-    path = os.path.dirname(path)  # containing directory: main project dir
-    return path
+       parent of the directory containing this script.  The result is
+       computed once per process.'''
+    global _project_path
+    if _project_path is None:
+        # abspath converts relative to absolute path; expanduser interprets ~
+        path = __file__  # path to this script
+        path = os.path.expanduser(path)  # interpret ~
+        path = os.path.abspath(path)  # convert to absolute path
+        path = os.path.dirname(path)  # containing directory: util
+        path = os.path.dirname(path)  # containing directory: main project dir
+        _project_path = path
+    return _project_path
 
 
 def get_build_path():
@@ -2,15 +2,13 @@
 from __future__ import print_function, division  # Division of integers with / should never round!
 import collections
 import contextlib
-import itertools, functools, operator
+import itertools, functools
 import logging
 import os, os.path
 import re
 import subprocess
-import threading
 import multiprocessing
 import sys
-import copy
 import yaml, json
 import time
 
@@ -24,9 +22,9 @@ MAX_INT32 = (2 ** 31)-1
 
 @contextlib.contextmanager
 def timer(prefix):
-    start = time.time()
+    start = time.monotonic()
     yield
-    finish = time.time()
+    finish = time.monotonic()
     elapsed = '{:.2f}'.format(finish - start)
     print(prefix + ' - ' + elapsed, file=sys.stderr)
 
@@ -5,24 +5,29 @@
 __author__ = "dpark@broadinstitute.org"
 __version__ = None
 
-import subprocess
 import os
 import re
-import time, datetime
+import time
 import os.path
 import util.misc
 
 
+_project_path = None
+
 def get_project_path():
     '''Return the absolute path of the top-level project, assumed to be the
-       parent of the directory containing this script.'''
-    # abspath converts relative to absolute path; expanduser interprets ~
-    path = __file__  # path to this script
-    path = os.path.expanduser(path)  # interpret ~
-    path = os.path.abspath(path)  # convert to absolute path
-    path = os.path.dirname(path)  # containing directory: util
-    path = os.path.dirname(path)  # containing directory: main project dir
-    return path
+       parent of the directory containing this script.  The result is
+       computed once per process.'''
+    global _project_path
+    if _project_path is None:
+        # abspath converts relative to absolute path; expanduser interprets ~
+        path = __file__  # path to this script
+        path = os.path.expanduser(path)  # interpret ~
+        path = os.path.abspath(path)  # convert to absolute path
+        path = os.path.dirname(path)  # containing directory: util
+        path = os.path.dirname(path)  # containing directory: main project dir
+        _project_path = path
+    return _project_path
 
 
 def call_git_describe():